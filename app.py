@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import hashlib
+import json
 import os
 
+# 업로드 파일 전처리 결과의 디스크 캐시 설정
+UPLOAD_CACHE_DIR = ".cache"
+UPLOAD_CACHE_MAX_FILES = 20
+# 전처리 결과 스키마가 바뀔 때 올려서 이전 캐시를 무효화
+UPLOAD_CACHE_VERSION = 3
+
 # Import data transformation module for new MOLIT API format support
-from data_transformer import auto_transform, detect_format
+from data_transformer import auto_transform, detect_format, LEGACY_COLUMNS, NEW_API_COLUMNS
 
 # 페이지 설정
 st.set_page_config(
@@ -14,87 +23,76 @@ st.set_page_config(
     layout="wide"
 )
 
-# 년월을 한글 형식으로 변환하는 함수
-def format_yearmonth_korean(yearmonth_str):
-    """년월 문자열을 한글 형식으로 변환 (예: '2025-01' -> '2025년 1월')"""
-    try:
-        if '-' in yearmonth_str:
-            year, month = yearmonth_str.split('-')
-            return f"{year}년 {int(month)}월"
-        return yearmonth_str
-    except:
-        return yearmonth_str
-
-# 계약년월을 한글 형식으로 변환하는 함수
-def format_contract_yearmonth(yearmonth):
-    """계약년월 숫자를 한글 형식으로 변환 (예: 202511 -> '2025년 11월')"""
-    try:
-        yearmonth_str = str(yearmonth)
-        if len(yearmonth_str) == 6:  # YYYYMM 형식
-            year = yearmonth_str[:4]
-            month = int(yearmonth_str[4:6])
-            return f"{year}년 {month}월"
-        elif len(yearmonth_str) == 4:  # YYYYMM 형식이지만 숫자로 표시된 경우
-            # 이미 처리된 형식일 수 있음
-            return yearmonth_str
-        return yearmonth_str
-    except:
-        return str(yearmonth)
+# 년월 컬럼을 한글 형식으로 변환하는 함수
+def yearmonth_series_korean(series):
+    """년월 Series를 한글 표기로 일괄 변환 (예: '2025-01'/202501 -> '2025년 1월')
+
+    행별 파이썬 호출 없이 문자열 커널 두 번으로 처리하며,
+    'YYYY-MM' 문자열과 YYYYMM 정수 입력을 모두 받는다.
+    """
+    s = series.astype('string')
+    return s.str.slice(0, 4) + '년 ' + s.str.slice(-2).str.lstrip('0') + '월'
 
 # 금액 축 레이블을 한글로 변환하는 함수
 def format_price_axis(fig, axis='y', max_value=None):
-    """차트의 금액 축 레이블을 한글(억원) 형식으로 변환"""
-    if max_value is None:
-        # 차트에서 최대값 추정
-        max_value = 300000  # 기본값
-    
-    # 틱 간격 계산 (만원 단위)
-    if max_value <= 50000:
-        dtick = 10000
-    elif max_value <= 100000:
-        dtick = 20000
-    elif max_value <= 200000:
-        dtick = 50000
-    else:
-        dtick = 100000
-    
-    # 틱 값 생성
-    tickvals = list(range(0, int(max_value) + dtick, dtick))
-    ticktext = []
-    for val in tickvals:
-        if val >= 10000:
-            ticktext.append(f"{val//10000}억원")
-        elif val > 0:
-            ticktext.append(f"{val}만원")
-        else:
-            ticktext.append("0")
-    
+    """금액 축에 천 단위 구분 기호와 만원 접미사를 적용
+
+    눈금 값/레이블 배열을 서버에서 만들어 보내는 대신 d3 tickformat으로
+    지정해 브라우저가 포맷하게 함 — payload에는 숫자만 실리고 줌/팬 시
+    재계산도 클라이언트에서 처리된다. max_value는 기존 호출부와의
+    호환을 위해 받지만 더 이상 쓰이지 않는다.
+    """
+    axis_format = dict(tickformat=',.0f', ticksuffix='만원')
     if axis == 'x':
-        fig.update_layout(
-            xaxis=dict(
-                tickmode='array',
-                tickvals=tickvals,
-                ticktext=ticktext
-            )
-        )
+        fig.update_layout(xaxis=axis_format)
     elif axis == 'y':
-        fig.update_layout(
-            yaxis=dict(
-                tickmode='array',
-                tickvals=tickvals,
-                ticktext=ticktext
-            )
-        )
+        fig.update_layout(yaxis=axis_format)
     elif axis == 'y2':
-        fig.update_layout(
-            yaxis2=dict(
-                tickmode='array',
-                tickvals=tickvals,
-                ticktext=ticktext
-            )
-        )
+        fig.update_layout(yaxis2=axis_format)
     return fig
 
+# 구양식/신양식에서 실제로 사용하는 컬럼만 파싱 대상으로 삼음
+_USED_COLUMNS = LEGACY_COLUMNS | NEW_API_COLUMNS
+
+# 구양식 컬럼의 고정 dtype (없는 키는 무시됨)
+# 층은 '5층' 같은 문자열 표기가 섞일 수 있어 string으로 읽고 전처리에서 정규화
+_READ_DTYPES = {
+    'NO': 'Int32',
+    '시군구': 'string',
+    '단지명': 'string',
+    '전용면적(㎡)': 'float32',
+    '계약년월': 'Int32',
+    '계약일': 'Int16',
+    '거래금액(만원)': 'string',
+    '층': 'string',
+    '건축년도': 'Int16',
+    '해제사유발생일': 'string',
+}
+
+# Excel 읽기 함수 (가능하면 calamine 엔진 사용)
+def read_first_sheet(src):
+    """첫 번째 시트를 가장 빠른 엔진으로 읽기
+
+    Uses the Rust-based calamine engine when python-calamine is
+    installed (roughly 2x faster parsing on large MOLIT exports) and
+    falls back to the default openpyxl engine otherwise.
+
+    Only the columns the dashboard consumes (legacy or new API format)
+    are decoded, and their dtypes are fixed up front so inference never
+    runs over strings we would discard anyway.
+    """
+    kwargs = dict(
+        sheet_name=0,
+        usecols=lambda c: c in _USED_COLUMNS,
+        dtype=_READ_DTYPES,
+    )
+    try:
+        return pd.read_excel(src, engine="calamine", **kwargs)
+    except ImportError:
+        if hasattr(src, "seek"):
+            src.seek(0)
+        return pd.read_excel(src, **kwargs)
+
 # 데이터 로드 및 전처리 함수 (파일 경로용 - 캐시 사용)
 @st.cache_data
 def load_data_from_path(filepath):
@@ -104,7 +102,7 @@ def load_data_from_path(filepath):
     transforms to legacy format if necessary for backward compatibility.
     """
     try:
-        df = pd.read_excel(filepath, sheet_name=0)
+        df = read_first_sheet(filepath)
     except Exception as e:
         st.error(f"파일 로드 중 오류 발생: {str(e)}")
         raise
@@ -128,18 +126,10 @@ def preprocess_data(df):
     
     # 0. 해제사유발생일이 있는 데이터(취소된 거래) 제외
     if '해제사유발생일' in df.columns:
-        # 값이 있는 것으로 간주되는 패턴들: '-'가 아니거나, 공백이 아니거나, 숫자가 있거나
-        def is_cancelled(val):
-            if pd.isna(val):
-                return False
-            val_str = str(val).strip()
-            # '-', '', 'nan', 'None' 등은 데이터가 없는 것으로 간주
-            if val_str in ['-', '', 'nan', 'None']:
-                return False
-            return True
-
-        cancelled_mask = df['해제사유발생일'].apply(is_cancelled)
-        cancelled_count = cancelled_mask.sum()
+        # '-', '', 'nan', 'None' 등은 데이터가 없는 것으로 간주 (벡터 연산으로 한 번에 처리)
+        s = df['해제사유발생일'].astype('string').str.strip()
+        cancelled_mask = s.notna() & ~s.isin(['-', '', 'nan', 'None'])
+        cancelled_count = int(cancelled_mask.sum())
         
         if cancelled_count > 0:
             df = df[~cancelled_mask].copy()
@@ -147,30 +137,115 @@ def preprocess_data(df):
         else:
             st.session_state['cancelled_count'] = 0
     
-    # 1. 거래금액(만원) 숫자 변환
-    if df['거래금액(만원)'].dtype == 'object':
-        df['거래금액(만원)'] = df['거래금액(만원)'].astype(str).str.replace(',', '').astype(int)
-    
-    # 2. 날짜 컬럼 생성 (계약년월 + 계약일)
-    df['계약일_str'] = df['계약일'].astype(str).str.zfill(2)
-    df['거래일자'] = pd.to_datetime(df['계약년월'].astype(str) + df['계약일_str'], format='%Y%m%d')
+    # 1. 거래금액(만원) 숫자 변환 (콤마 제거 후 int32로 한 번에 변환)
+    price = df['거래금액(만원)']
+    if not pd.api.types.is_numeric_dtype(price):
+        price = pd.to_numeric(price.astype('string').str.replace(',', '', regex=False))
+    # 만원 단위 금액은 int32 범위로 충분 — 메모리와 집계 비용 절반
+    df['거래금액(만원)'] = price.astype(np.int32)
     
-    # 3. 평수 계산 (전용면적 / 3.3)
-    df['평수'] = df['전용면적(㎡)'] / 3.3
+    # 2. 날짜 컬럼 생성 (계약년월*100 + 계약일 정수 연산 후 단일 변환)
+    ymd = (pd.to_numeric(df['계약년월']).to_numpy(np.int64) * 100
+           + pd.to_numeric(df['계약일']).to_numpy(np.int64))
+    df['거래일자'] = pd.to_datetime(ymd, format='%Y%m%d', cache=True)
+    # 월별 집계 키도 여기서 한 번만 계산 (필터 후 재계산 불필요)
+    df['년월'] = df['거래일자'].dt.to_period('M').astype(str)
     
-    # 4. 평당가 계산 (거래금액 / 평수)
-    df['평당가(만원)'] = df['거래금액(만원)'] / df['평수']
+    # 3~4. 평수/평당가 계산 — float32 배열에서 한 번에 계산
+    # (float64 중간 결과를 만들었다가 다운캐스트하는 비용 제거,
+    #  상수 나눗셈은 역수 곱으로 대체)
+    df['전용면적(㎡)'] = df['전용면적(㎡)'].astype(np.float32, copy=False)
+    area = df['전용면적(㎡)'].to_numpy()
+    pyeong = area * np.float32(1.0 / 3.3)
+    df['평수'] = pyeong
+    df['평당가(만원)'] = df['거래금액(만원)'].to_numpy(np.float32) / pyeong
+
+    # 5. 평형/층수 구간 분류 (행별 apply 대신 pd.cut으로 한 번만 계산)
+    df['평형구분'] = pd.cut(
+        df['전용면적(㎡)'],
+        bins=[-np.inf, 60, 85, 102, 135, np.inf],
+        right=False,
+        labels=['소형(59㎡이하)', '중소형(59~84㎡)', '중형(85~102㎡)',
+                '중대형(102~135㎡)', '대형(135㎡초과)'])
+    floor_num = pd.to_numeric(
+        df['층'].astype('string').str.replace('층', '', regex=False).str.strip(),
+        errors='coerce')
+    df['층수구간'] = pd.cut(
+        floor_num,
+        bins=[-np.inf, 5, 15, 30, np.inf],
+        labels=['저층(1~5층)', '중층(6~15층)', '고층(16~30층)', '초고층(31층 이상)']
+    ).cat.add_categories(['정보없음']).fillna('정보없음')
+
+    # 6. 수치 컬럼 다운캐스트 (금액/면적 계열은 위에서 이미 int32/float32)
+    df['건축년도'] = pd.to_numeric(df['건축년도'], errors='coerce').astype('Int16')
+
+    # 7. 반복 문자열 컬럼을 Categorical로 (카테고리 = 정렬된 고유값)
+    df['시군구'] = pd.Categorical(df['시군구'])
+    df['단지명'] = pd.Categorical(df['단지명'])
+
+    # 8. 탭에서 쓰던 행 단위 파생 컬럼 — 필터와 무관하므로 업로드 시 한 번만 계산
+    df['주'] = df['거래일자'].dt.to_period('W').astype(str)
+    df['층수_숫자'] = pd.to_numeric(
+        df['층'].astype('string').str.extract(r'(-?\d+)', expand=False),
+        errors='coerce').astype('Int64')
+    df['금액구간'] = pd.cut(
+        df['거래금액(만원)'],
+        bins=[0, 50000, 100000, 150000, 200000, 300000, 9999999],
+        labels=['5억 미만', '5억~10억', '10억~15억', '15억~20억', '20억~30억', '30억 이상'])
+    is_new = df['건축년도'].to_numpy(dtype='float32', na_value=np.nan) >= 2015
+    df['건물유형'] = pd.Categorical.from_codes(
+        is_new.astype(np.int8), categories=['구축', '신축(10년이내)'])
     return df
 
-# 업로드된 파일 로드 함수 (캐시 사용 안 함)
+# 업로드 캐시 정리 함수 (LRU 방식)
+def _evict_upload_cache(max_files=UPLOAD_CACHE_MAX_FILES):
+    """캐시 파일 개수를 제한 (가장 오래 사용하지 않은 것부터 삭제)"""
+    try:
+        paths = [os.path.join(UPLOAD_CACHE_DIR, f)
+                 for f in os.listdir(UPLOAD_CACHE_DIR) if f.endswith('.parquet')]
+        if len(paths) <= max_files:
+            return
+        paths.sort(key=os.path.getmtime)
+        for p in paths[:len(paths) - max_files]:
+            for q in (p, p[:-len('.parquet')] + '.json'):
+                try:
+                    os.remove(q)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+# 업로드된 파일 로드 함수 (파일 해시 기반 parquet 캐시 사용)
 def load_data_from_upload(uploaded_file):
-    """업로드된 파일로부터 데이터 로드 (캐시 사용 안 함)
+    """업로드된 파일로부터 데이터 로드 (파일 해시 기반 디스크 캐시)
 
     Automatically detects file format (legacy or new MOLIT API) and
     transforms to legacy format if necessary for backward compatibility.
+
+    The preprocessed frame is cached to parquet keyed by a hash of the
+    uploaded bytes, so re-uploading (or rerunning on) the same file
+    skips the Excel parse and preprocessing entirely. Cache failures
+    (e.g. pyarrow not installed) silently fall back to a fresh parse.
     """
+    data = uploaded_file.getvalue()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cache_path = os.path.join(UPLOAD_CACHE_DIR, f"{digest}-v{UPLOAD_CACHE_VERSION}.parquet")
+    meta_path = os.path.join(UPLOAD_CACHE_DIR, f"{digest}-v{UPLOAD_CACHE_VERSION}.json")
+
+    try:
+        if os.path.exists(cache_path) and os.path.exists(meta_path):
+            df = pd.read_parquet(cache_path)
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            st.session_state['cancelled_count'] = meta.get('cancelled_count', 0)
+            st.session_state['file_format_converted'] = meta.get('file_format_converted', False)
+            os.utime(cache_path)  # LRU 갱신
+            return df
+    except Exception:
+        pass  # 캐시 손상 등은 새로 파싱으로 대체
+
     try:
-        df = pd.read_excel(uploaded_file, sheet_name=0)
+        df = read_first_sheet(uploaded_file)
     except Exception as e:
         st.error(f"파일 로드 중 오류 발생: {str(e)}")
         raise
@@ -188,7 +263,256 @@ def load_data_from_upload(uploaded_file):
         raise
 
     # 전처리
-    return preprocess_data(df)
+    df = preprocess_data(df)
+
+    # 캐시 저장 (실패해도 동작에는 영향 없음)
+    try:
+        os.makedirs(UPLOAD_CACHE_DIR, exist_ok=True)
+        df.to_parquet(cache_path, compression='zstd')
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'cancelled_count': int(st.session_state.get('cancelled_count', 0)),
+                'file_format_converted': bool(st.session_state.get('file_format_converted', False)),
+            }, f)
+        _evict_upload_cache()
+    except Exception:
+        pass
+
+    return df
+
+# 필터 위젯용 파생값 계산 (df에만 의존 → 위젯 조작 시 재계산 불필요)
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_facets(df):
+    """지역/단지 목록과 날짜·면적 범위를 한 번만 계산"""
+    empty_area = df['전용면적(㎡)'].empty
+    return {
+        'regions': list(df['시군구'].cat.categories),
+        'complexes': list(df['단지명'].cat.categories),
+        'min_date': df['거래일자'].min(),
+        'max_date': df['거래일자'].max(),
+        'min_area': float(df['전용면적(㎡)'].min()) if not empty_area else 0.0,
+        'max_area': float(df['전용면적(㎡)'].max()) if not empty_area else 100.0,
+    }
+
+# 데이터프레임을 캐시 키로 해시하는 함수 (pandas의 C 구현 해시 사용)
+_DF_HASH = {pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).sum()}
+
+# 월별 거래량/평균가 복합 차트 (같은 필터로 재방문 시 캐시에서 재사용)
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def build_monthly_overview_chart(monthly_stats):
+    fig1 = go.Figure()
+
+    # 거래량 (막대)
+    fig1.add_trace(go.Bar(
+        x=monthly_stats['년월_한글'],
+        y=monthly_stats['거래량'],
+        name='거래량(건)',
+        marker_color='lightblue',
+        yaxis='y2'
+    ))
+
+    # 평균거래금액 (선)
+    fig1.add_trace(go.Scatter(
+        x=monthly_stats['년월_한글'],
+        y=monthly_stats['평균거래금액'],
+        name='평균거래금액(만원)',
+        mode='lines+markers',
+        line=dict(color='firebrick', width=3)
+    ))
+
+    fig1.update_layout(
+        title='월별 거래량 및 평균 거래금액 추이',
+        xaxis_title='년월',
+        yaxis=dict(title='평균 거래금액(만원)'),
+        yaxis2=dict(title='거래량(건)', overlaying='y', side='right'),
+        legend=dict(x=0, y=1.1, orientation='h'),
+        hovermode="x unified"
+    )
+    # y축 금액 레이블을 한글로 변환
+    return format_price_axis(fig1, axis='y', max_value=monthly_stats['평균거래금액'].max())
+
+# 주간별 거래량/평균가 차트
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def build_weekly_charts(weekly_stats):
+    fig_weekly = go.Figure()
+
+    # 거래량 (막대)
+    fig_weekly.add_trace(go.Bar(
+        x=weekly_stats['주'],
+        y=weekly_stats['거래량'],
+        name='주간 거래량(건)',
+        marker_color='steelblue',
+        text=weekly_stats['거래량'],
+        textposition='outside'
+    ))
+
+    fig_weekly.update_layout(
+        title='주간별 거래량 추이',
+        xaxis_title='주 (Year-Week)',
+        yaxis_title='거래량(건)',
+        hovermode="x unified",
+        xaxis=dict(tickangle=-45)
+    )
+
+    # 주간별 평균 거래금액도 함께 표시 (선택사항)
+    fig_weekly_price = px.line(
+        weekly_stats,
+        x='주',
+        y='평균거래금액',
+        markers=True,
+        title='주간별 평균 거래금액 추이',
+        labels={'평균거래금액': '평균 거래금액(만원)', '주': '주 (Year-Week)'}
+    )
+    fig_weekly_price.update_layout(
+        xaxis=dict(tickangle=-45),
+        hovermode="x unified"
+    )
+    # y축 금액 레이블을 한글로 변환
+    fig_weekly_price = format_price_axis(
+        fig_weekly_price, axis='y', max_value=weekly_stats['평균거래금액'].max())
+    return fig_weekly, fig_weekly_price
+
+# 이동평균 추세 차트와 전월 대비 변화율 차트
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def build_trend_charts(monthly_stats_sorted):
+    fig_trend = go.Figure()
+
+    # 실제 평균 거래금액
+    fig_trend.add_trace(go.Scatter(
+        x=monthly_stats_sorted['년월_한글'],
+        y=monthly_stats_sorted['평균거래금액'],
+        name='월평균 거래금액',
+        mode='lines+markers',
+        line=dict(color='firebrick', width=2),
+        marker=dict(size=8)
+    ))
+
+    # 3개월 이동평균
+    fig_trend.add_trace(go.Scatter(
+        x=monthly_stats_sorted['년월_한글'],
+        y=monthly_stats_sorted['이동평균_3개월'],
+        name='3개월 이동평균',
+        mode='lines',
+        line=dict(color='blue', width=2, dash='dash')
+    ))
+
+    # 6개월 이동평균
+    fig_trend.add_trace(go.Scatter(
+        x=monthly_stats_sorted['년월_한글'],
+        y=monthly_stats_sorted['이동평균_6개월'],
+        name='6개월 이동평균',
+        mode='lines',
+        line=dict(color='green', width=2, dash='dot')
+    ))
+
+    fig_trend.update_layout(
+        title='가격 추세 분석 (이동평균선 포함)',
+        xaxis_title='년월',
+        yaxis_title='평균 거래금액(만원)',
+        hovermode="x unified",
+        legend=dict(x=0, y=1.1, orientation='h')
+    )
+    # y축 금액 레이블을 한글로 변환
+    fig_trend = format_price_axis(
+        fig_trend, axis='y', max_value=monthly_stats_sorted['평균거래금액'].max())
+
+    # 변화율 막대 차트 (상승/하락 색상 구분) — 원소별 람다 대신 벡터 연산
+    change = monthly_stats_sorted['전월대비변화율'].to_numpy()
+    change_colors = np.select(
+        [change > 0, change < 0],
+        ['rgba(34, 139, 34, 0.6)', 'rgba(220, 20, 60, 0.6)'],
+        default='rgba(128, 128, 128, 0.6)'
+    )
+    change_text = np.where(
+        np.isnan(change), '-',
+        np.char.add(np.round(change, 1).astype(str), '%')
+    )
+
+    fig_change = go.Figure()
+    fig_change.add_trace(go.Bar(
+        x=monthly_stats_sorted['년월_한글'],
+        y=monthly_stats_sorted['전월대비변화율'],
+        name='전월 대비 변화율(%)',
+        marker_color=change_colors,
+        text=change_text,
+        textposition='outside'
+    ))
+
+    fig_change.update_layout(
+        title='전월 대비 가격 변화율 (%)',
+        xaxis_title='년월',
+        yaxis_title='변화율 (%)',
+        hovermode="x unified"
+    )
+    fig_change.add_hline(y=0, line_dash="dash", line_color="black", opacity=0.3)
+    return fig_trend, fig_change
+
+# 층수 구간별 평균/건수 (탭5) — 층수구간은 ordered categorical이라 결과가 이미 구간 순서
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_floor_group(filtered_df):
+    floor_group = filtered_df.groupby('층수구간', observed=True).agg({
+        '거래금액(만원)': 'mean',
+        '평당가(만원)': 'mean',
+        'NO': 'count'
+    }).reset_index()
+    floor_group.columns = ['층수구간', '평균거래금액', '평균평당가', '거래건수']
+    return floor_group
+
+# 층수 구간별 상세 통계 (탭5)
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_floor_stats(filtered_df):
+    floor_stats = filtered_df.groupby('층수구간', observed=True).agg({
+        '거래금액(만원)': ['count', 'mean', 'min', 'max'],
+        '평당가(만원)': 'mean'
+    }).reset_index()
+    floor_stats.columns = ['층수구간', '거래건수', '평균거래금액', '최저가', '최고가', '평균평당가']
+    return floor_stats
+
+# 지역별 비교 집계 (탭6)
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_region_comparison(filtered_df):
+    region_comparison = filtered_df.groupby('시군구', observed=True).agg({
+        '거래금액(만원)': ['mean', 'count'],
+        '평당가(만원)': 'mean'
+    }).reset_index()
+    region_comparison.columns = ['시군구', '평균거래금액', '거래건수', '평균평당가']
+    return region_comparison.sort_values('평균거래금액', ascending=False)
+
+# 단지별 순위 테이블 (탭7): 거래량/평균가/평당가 TOP 10과 상위 단지 가격 범위
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_complex_rankings(filtered_df):
+    vol_counts = filtered_df['단지명'].value_counts()
+    vol_counts = vol_counts[vol_counts > 0]
+
+    top_vol_apt = vol_counts.head(10).reset_index()
+    top_vol_apt.columns = ['단지명', '거래건수']
+
+    top_price_apt = filtered_df.groupby('단지명', observed=True)['거래금액(만원)'].mean().nlargest(10).reset_index()
+
+    top_pyeong_apt = filtered_df.groupby('단지명', observed=True)['평당가(만원)'].mean().nlargest(10).reset_index()
+    top_pyeong_apt.columns = ['단지명', '평당가(만원)']
+
+    # 거래량 상위 10개 단지의 가격 범위 (위 value_counts 결과 재사용)
+    top_10_complexes = set(vol_counts.index[:10])
+    price_range_df = filtered_df[filtered_df['단지명'].isin(top_10_complexes)]
+    price_stats = price_range_df.groupby('단지명', observed=True)['거래금액(만원)'].agg(['min', 'max', 'mean']).reset_index()
+    price_stats.columns = ['단지명', '최저가', '최고가', '평균가']
+    price_stats = price_stats.sort_values('평균가', ascending=False)
+
+    return top_vol_apt, top_price_apt, top_pyeong_apt, price_stats
+
+# 탭들이 공유하는 집계 테이블 (filtered_df에만 의존 → 필터 변경 시에만 재계산)
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_summaries(filtered_df):
+    """지역/평형/건축년도/월별 groupby를 한 번의 패스 구성으로 계산"""
+    agg_spec = {'거래금액(만원)': ['count', 'mean', 'max', 'min'], '평당가(만원)': 'mean'}
+    return {
+        'region': filtered_df.groupby('시군구', observed=True).agg(agg_spec),
+        'area': filtered_df.groupby('평형구분', observed=True).agg(agg_spec),
+        'year': filtered_df.groupby('건축년도', observed=True).agg(agg_spec),
+        'monthly': filtered_df.groupby('년월').agg(
+            {'거래금액(만원)': 'mean', 'NO': 'count'}),
+    }
 
 # 메인 함수
 def main():
@@ -256,15 +580,18 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🔍 검색 필터")
     
+    # 필터에 쓰이는 파생값은 캐시에서 가져옴
+    facets = compute_facets(df)
+
     # 1. 지역 필터 (접을 수 있게)
-    regions = sorted(df['시군구'].unique())
+    regions = facets['regions']
     selected_region = regions  # 기본값: 전체 지역
     
     with st.sidebar.expander("📍 지역 선택", expanded=False):
         selected_region = st.multiselect("시군구", regions, default=regions, label_visibility="collapsed")
     
     # 2. 단지명 검색/필터 (접을 수 있게)
-    all_complexes = sorted(df['단지명'].unique())
+    all_complexes = facets['complexes']
     selected_complexes = all_complexes  # 기본값: 전체 단지
     
     with st.sidebar.expander("🏢 단지명 검색", expanded=False):
@@ -319,8 +646,8 @@ def main():
     
     # 3. 날짜 필터 (접을 수 있게)
     # NaT 또는 빈 데이터 대응
-    min_date = df['거래일자'].min()
-    max_date = df['거래일자'].max()
+    min_date = facets['min_date']
+    max_date = facets['max_date']
     
     if pd.isna(min_date) or pd.isna(max_date):
         st.error("데이터에서 유효한 거래일자를 찾을 수 없습니다.")
@@ -332,8 +659,8 @@ def main():
         date_range = st.date_input("조회 기간", [min_date, max_date], label_visibility="collapsed")
     
     # 4. 전용면적 필터 (접을 수 있게)
-    min_area = float(df['전용면적(㎡)'].min()) if not df['전용면적(㎡)'].empty else 0.0
-    max_area = float(df['전용면적(㎡)'].max()) if not df['전용면적(㎡)'].empty else 100.0
+    min_area = facets['min_area']
+    max_area = facets['max_area']
     
     if pd.isna(min_area) or pd.isna(max_area):
         min_area, max_area = 0.0, 100.0
@@ -355,20 +682,28 @@ def main():
     if not selected_region:
         selected_region = regions
     
-    mask = df['시군구'].isin(selected_region)
-    
+    # 필터 조건들을 numpy 배열로 모아 마지막에 한 번만 결합
+    # (Series 간 & 체인이 만드는 중간 불리언 Series 할당을 줄임)
+    conds = [df['시군구'].isin(selected_region).to_numpy()]
+
     # 단지명 필터 적용
     if selected_complexes and len(selected_complexes) < len(all_complexes):
-        mask = mask & (df['단지명'].isin(selected_complexes))
-    
+        conds.append(df['단지명'].isin(selected_complexes).to_numpy())
+
     # 날짜 필터 적용
     if len(date_range) == 2:
-        mask = mask & (df['거래일자'] >= pd.to_datetime(date_range[0])) & (df['거래일자'] <= pd.to_datetime(date_range[1]))
-    
+        start_ts = pd.to_datetime(date_range[0]).to_datetime64()
+        end_ts = pd.to_datetime(date_range[1]).to_datetime64()
+        dates = df['거래일자'].to_numpy()
+        conds.append((dates >= start_ts) & (dates <= end_ts))
+
     # 전용면적 필터 적용
-    mask = mask & (df['전용면적(㎡)'] >= area_range[0]) & (df['전용면적(㎡)'] <= area_range[1])
-    
-    filtered_df = df[mask].copy()
+    area = df['전용면적(㎡)'].to_numpy()
+    conds.append((area >= area_range[0]) & (area <= area_range[1]))
+
+    mask = np.logical_and.reduce(conds)
+    # 이후 컬럼 추가는 CoW 덕에 원본과 분리되므로 명시적 copy() 불필요
+    filtered_df = df.loc[mask]
     
     # 필터링된 데이터 정보 표시
     info_text = f"선택된 데이터: 총 {len(filtered_df):,} 건의 거래 내역이 있습니다."
@@ -386,9 +721,13 @@ def main():
         info_text += f"\n\n📐 전용면적: {area_range[0]:.1f}㎡ ~ {area_range[1]:.1f}㎡"
     
     st.info(info_text)
-    
-    # 탭 구성
-    tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+
+    # 탭 전반에서 재사용하는 집계 테이블
+    summaries = compute_summaries(filtered_df)
+
+    # 탭 구성 — st.tabs는 매 rerun마다 9개 탭 본문을 전부 실행하므로,
+    # 라디오로 선택된 탭의 본문만 실행해 나머지 8개 탭의 차트 생성 비용을 건너뜀
+    tab_names = [
         "📊 요약 대시보드",
         "📅 기간별 분석", 
         "💰 금액별 분석", 
@@ -398,10 +737,12 @@ def main():
         "🗺️ 지역별 비교",
         "🏢 단지별 분석",
         "📈 신고가 추세 분석"
-    ])
+    ]
+    active_tab = st.radio(
+        "분석 메뉴", tab_names, horizontal=True, label_visibility="collapsed")
     
     # --- 0. 요약 대시보드 ---
-    with tab0:
+    if active_tab == tab_names[0]:
         st.subheader("📊 핵심 지표 요약")
         
         # KPI 카드
@@ -431,165 +772,81 @@ def main():
         
         with col_sum1:
             st.markdown("### 지역별 요약 통계")
-            region_summary = filtered_df.groupby('시군구').agg({
-                '거래금액(만원)': ['count', 'mean'],
-                '평당가(만원)': 'mean'
-            }).reset_index()
-            region_summary.columns = ['시군구', '거래건수', '평균거래금액(만원)', '평균평당가(만원)']
-            region_summary = region_summary.sort_values('거래건수', ascending=False)
-            region_summary['평균거래금액(만원)'] = region_summary['평균거래금액(만원)'].round(0).astype(int)
-            region_summary['평균평당가(만원)'] = region_summary['평균평당가(만원)'].round(0).astype(int)
+            region = summaries['region']
+            region_summary = pd.DataFrame({
+                '시군구': region.index,
+                '거래건수': region[('거래금액(만원)', 'count')].to_numpy(),
+                '평균거래금액(만원)': region[('거래금액(만원)', 'mean')].round(0).astype(int).to_numpy(),
+                '평균평당가(만원)': region[('평당가(만원)', 'mean')].round(0).astype(int).to_numpy(),
+            }).sort_values('거래건수', ascending=False)
             st.dataframe(region_summary, use_container_width=True, hide_index=True)
         
         with col_sum2:
             st.markdown("### 평형대별 요약 통계")
-            # 평형 구분 함수 재사용
-            def get_area_type(x):
-                if x < 60: return '소형(59㎡이하)'
-                elif x < 85: return '중소형(59~84㎡)'
-                elif x < 102: return '중형(85~102㎡)'
-                elif x < 135: return '중대형(102~135㎡)'
-                else: return '대형(135㎡초과)'
-            
-            filtered_df['평형구분'] = filtered_df['전용면적(㎡)'].apply(get_area_type)
-            area_summary = filtered_df.groupby('평형구분').agg({
-                '거래금액(만원)': ['count', 'mean', 'max', 'min'],
-                '평당가(만원)': 'mean'
-            }).reset_index()
-            area_summary.columns = ['평형구분', '거래건수', '평균거래금액(만원)', '최고가(만원)', '최저가(만원)', '평균평당가(만원)']
-            order_list = ['소형(59㎡이하)', '중소형(59~84㎡)', '중형(85~102㎡)', '중대형(102~135㎡)', '대형(135㎡초과)']
-            existing_categories = [cat for cat in order_list if cat in area_summary['평형구분'].values]
-            area_summary['평형구분'] = pd.Categorical(area_summary['평형구분'], categories=existing_categories, ordered=True)
-            area_summary = area_summary.sort_values('평형구분')
-            area_summary['평균거래금액(만원)'] = area_summary['평균거래금액(만원)'].round(0).astype(int)
-            area_summary['최고가(만원)'] = area_summary['최고가(만원)'].round(0).astype(int)
-            area_summary['최저가(만원)'] = area_summary['최저가(만원)'].round(0).astype(int)
-            area_summary['평균평당가(만원)'] = area_summary['평균평당가(만원)'].round(0).astype(int)
+            # 평형구분은 ordered categorical이라 groupby 결과가 이미 평형 순서
+            area = summaries['area']
+            area_summary = pd.DataFrame({
+                '평형구분': area.index,
+                '거래건수': area[('거래금액(만원)', 'count')].to_numpy(),
+                '평균거래금액(만원)': area[('거래금액(만원)', 'mean')].round(0).astype(int).to_numpy(),
+                '최고가(만원)': area[('거래금액(만원)', 'max')].round(0).astype(int).to_numpy(),
+                '최저가(만원)': area[('거래금액(만원)', 'min')].round(0).astype(int).to_numpy(),
+                '평균평당가(만원)': area[('평당가(만원)', 'mean')].round(0).astype(int).to_numpy(),
+            })
             st.dataframe(area_summary, use_container_width=True, hide_index=True)
         
         st.markdown("---")
         
         # 건축년도별 요약
         st.markdown("### 건축년도별 요약 통계")
-        year_summary = filtered_df.groupby('건축년도').agg({
-            '거래금액(만원)': ['count', 'mean'],
-            '평당가(만원)': 'mean'
-        }).reset_index()
-        year_summary.columns = ['건축년도', '거래건수', '평균거래금액(만원)', '평균평당가(만원)']
-        year_summary = year_summary.sort_values('건축년도', ascending=False)
-        year_summary['평균거래금액(만원)'] = year_summary['평균거래금액(만원)'].round(0).astype(int)
-        year_summary['평균평당가(만원)'] = year_summary['평균평당가(만원)'].round(0).astype(int)
+        year = summaries['year']
+        year_summary = pd.DataFrame({
+            '건축년도': year.index,
+            '거래건수': year[('거래금액(만원)', 'count')].to_numpy(),
+            '평균거래금액(만원)': year[('거래금액(만원)', 'mean')].round(0).astype(int).to_numpy(),
+            '평균평당가(만원)': year[('평당가(만원)', 'mean')].round(0).astype(int).to_numpy(),
+        }).sort_values('건축년도', ascending=False)
         st.dataframe(year_summary, use_container_width=True, hide_index=True)
         
         st.markdown("---")
         
         # 최근 거래 TOP 5
         st.markdown("### 최근 거래 TOP 5")
-        recent_transactions = filtered_df.nlargest(5, '거래일자')[['거래일자', '시군구', '단지명', '전용면적(㎡)', '층', '거래금액(만원)', '평당가(만원)', '건축년도']].copy()
+        # 컬럼을 먼저 추려서 nlargest가 필요한 열만 옮기도록 함
+        recent_cols = ['거래일자', '시군구', '단지명', '전용면적(㎡)', '층', '거래금액(만원)', '평당가(만원)', '건축년도']
+        recent_transactions = filtered_df[recent_cols].nlargest(5, '거래일자')
         recent_transactions['거래일자'] = recent_transactions['거래일자'].dt.strftime('%Y-%m-%d')
         recent_transactions['평당가(만원)'] = recent_transactions['평당가(만원)'].round(0).astype(int)
         st.dataframe(recent_transactions, use_container_width=True, hide_index=True)
     
     # --- 1. 기간별 분석 ---
-    with tab1:
+    elif active_tab == tab_names[1]:
         st.subheader("기간별 거래량 및 평균 시세 추이")
         
-        # 월별 데이터 집계
-        filtered_df['년월'] = filtered_df['거래일자'].dt.to_period('M').astype(str)
-        # 년월을 한글 형식으로 변환
-        filtered_df['년월_한글'] = filtered_df['년월'].apply(format_yearmonth_korean)
-        monthly_stats = filtered_df.groupby('년월').agg({
-            '거래금액(만원)': 'mean',
-            'NO': 'count'
-        }).reset_index()
+        # 월별 데이터 집계 (공유 집계 테이블 재사용)
+        monthly_stats = summaries['monthly'].reset_index()
         monthly_stats.columns = ['년월', '평균거래금액', '거래량']
         # 년월을 한글 형식으로 변환
-        monthly_stats['년월_한글'] = monthly_stats['년월'].apply(format_yearmonth_korean)
-        
-        # 복합 차트 (Bar: 거래량, Line: 금액)
-        fig1 = go.Figure()
-        
-        # 거래량 (막대)
-        fig1.add_trace(go.Bar(
-            x=monthly_stats['년월_한글'],
-            y=monthly_stats['거래량'],
-            name='거래량(건)',
-            marker_color='lightblue',
-            yaxis='y2'
-        ))
-        
-        # 평균거래금액 (선)
-        fig1.add_trace(go.Scatter(
-            x=monthly_stats['년월_한글'],
-            y=monthly_stats['평균거래금액'],
-            name='평균거래금액(만원)',
-            mode='lines+markers',
-            line=dict(color='firebrick', width=3)
-        ))
+        monthly_stats['년월_한글'] = yearmonth_series_korean(monthly_stats['년월'])
         
-        fig1.update_layout(
-            title='월별 거래량 및 평균 거래금액 추이',
-            xaxis_title='년월',
-            yaxis=dict(title='평균 거래금액(만원)'),
-            yaxis2=dict(title='거래량(건)', overlaying='y', side='right'),
-            legend=dict(x=0, y=1.1, orientation='h'),
-            hovermode="x unified"
-        )
-        # y축 금액 레이블을 한글로 변환
-        max_price = monthly_stats['평균거래금액'].max()
-        fig1 = format_price_axis(fig1, axis='y', max_value=max_price)
+        # 복합 차트 (Bar: 거래량, Line: 금액) — 캐시된 빌더 사용
+        fig1 = build_monthly_overview_chart(monthly_stats)
         st.plotly_chart(fig1, use_container_width=True)
         
         # 주간별 데이터 집계
         st.markdown("---")
         st.subheader("주간별 거래량 추이")
         
-        # 주간 데이터 집계 (주 시작일 기준)
-        filtered_df['주'] = filtered_df['거래일자'].dt.to_period('W').astype(str)
+        # 주간 데이터 집계 (주 시작일 기준, 주 컬럼은 preprocess_data에서 계산됨)
         weekly_stats = filtered_df.groupby('주').agg({
             'NO': 'count',
             '거래금액(만원)': 'mean'
         }).reset_index()
         weekly_stats.columns = ['주', '거래량', '평균거래금액']
         
-        # 주간별 거래량 차트
-        fig_weekly = go.Figure()
-        
-        # 거래량 (막대)
-        fig_weekly.add_trace(go.Bar(
-            x=weekly_stats['주'],
-            y=weekly_stats['거래량'],
-            name='주간 거래량(건)',
-            marker_color='steelblue',
-            text=weekly_stats['거래량'],
-            textposition='outside'
-        ))
-        
-        fig_weekly.update_layout(
-            title='주간별 거래량 추이',
-            xaxis_title='주 (Year-Week)',
-            yaxis_title='거래량(건)',
-            hovermode="x unified",
-            xaxis=dict(tickangle=-45)
-        )
+        # 주간별 거래량/평균가 차트 — 캐시된 빌더 사용
+        fig_weekly, fig_weekly_price = build_weekly_charts(weekly_stats)
         st.plotly_chart(fig_weekly, use_container_width=True)
-        
-        # 주간별 평균 거래금액도 함께 표시 (선택사항)
-        fig_weekly_price = px.line(
-            weekly_stats,
-            x='주',
-            y='평균거래금액',
-            markers=True,
-            title='주간별 평균 거래금액 추이',
-            labels={'평균거래금액': '평균 거래금액(만원)', '주': '주 (Year-Week)'}
-        )
-        fig_weekly_price.update_layout(
-            xaxis=dict(tickangle=-45),
-            hovermode="x unified"
-        )
-        # y축 금액 레이블을 한글로 변환
-        max_price = weekly_stats['평균거래금액'].max()
-        fig_weekly_price = format_price_axis(fig_weekly_price, axis='y', max_value=max_price)
         st.plotly_chart(fig_weekly_price, use_container_width=True)
         
         # 가격 추세 분석
@@ -604,79 +861,16 @@ def main():
         monthly_stats_sorted['이동평균_3개월'] = monthly_stats_sorted['평균거래금액'].rolling(window=3, min_periods=1).mean()
         monthly_stats_sorted['이동평균_6개월'] = monthly_stats_sorted['평균거래금액'].rolling(window=6, min_periods=1).mean()
         # 년월을 한글 형식으로 변환
-        monthly_stats_sorted['년월_한글'] = monthly_stats_sorted['년월'].apply(format_yearmonth_korean)
-        
-        # 추세 차트 (이동평균선 포함)
-        fig_trend = go.Figure()
-        
-        # 실제 평균 거래금액
-        fig_trend.add_trace(go.Scatter(
-            x=monthly_stats_sorted['년월_한글'],
-            y=monthly_stats_sorted['평균거래금액'],
-            name='월평균 거래금액',
-            mode='lines+markers',
-            line=dict(color='firebrick', width=2),
-            marker=dict(size=8)
-        ))
+        monthly_stats_sorted['년월_한글'] = yearmonth_series_korean(monthly_stats_sorted['년월'])
         
-        # 3개월 이동평균
-        fig_trend.add_trace(go.Scatter(
-            x=monthly_stats_sorted['년월_한글'],
-            y=monthly_stats_sorted['이동평균_3개월'],
-            name='3개월 이동평균',
-            mode='lines',
-            line=dict(color='blue', width=2, dash='dash')
-        ))
-        
-        # 6개월 이동평균
-        fig_trend.add_trace(go.Scatter(
-            x=monthly_stats_sorted['년월_한글'],
-            y=monthly_stats_sorted['이동평균_6개월'],
-            name='6개월 이동평균',
-            mode='lines',
-            line=dict(color='green', width=2, dash='dot')
-        ))
-        
-        fig_trend.update_layout(
-            title='가격 추세 분석 (이동평균선 포함)',
-            xaxis_title='년월',
-            yaxis_title='평균 거래금액(만원)',
-            hovermode="x unified",
-            legend=dict(x=0, y=1.1, orientation='h')
-        )
-        # y축 금액 레이블을 한글로 변환
-        max_price = monthly_stats_sorted['평균거래금액'].max()
-        fig_trend = format_price_axis(fig_trend, axis='y', max_value=max_price)
+        # 추세/변화율 차트 — 캐시된 빌더 사용
+        fig_trend, fig_change = build_trend_charts(monthly_stats_sorted)
         st.plotly_chart(fig_trend, use_container_width=True)
         
         # 전월 대비 변화율 차트
         col_trend1, col_trend2 = st.columns(2)
         
         with col_trend1:
-            # 변화율 막대 차트 (상승/하락 색상 구분)
-            monthly_stats_sorted['변화율_색상'] = monthly_stats_sorted['전월대비변화율'].apply(
-                lambda x: 'green' if x > 0 else 'red' if x < 0 else 'gray'
-            )
-            
-            fig_change = go.Figure()
-            fig_change.add_trace(go.Bar(
-                x=monthly_stats_sorted['년월_한글'],
-                y=monthly_stats_sorted['전월대비변화율'],
-                name='전월 대비 변화율(%)',
-                marker_color=monthly_stats_sorted['전월대비변화율'].apply(
-                    lambda x: 'rgba(34, 139, 34, 0.6)' if x > 0 else 'rgba(220, 20, 60, 0.6)' if x < 0 else 'rgba(128, 128, 128, 0.6)'
-                ),
-                text=[f"{x:.1f}%" if pd.notna(x) else "-" for x in monthly_stats_sorted['전월대비변화율']],
-                textposition='outside'
-            ))
-            
-            fig_change.update_layout(
-                title='전월 대비 가격 변화율 (%)',
-                xaxis_title='년월',
-                yaxis_title='변화율 (%)',
-                hovermode="x unified"
-            )
-            fig_change.add_hline(y=0, line_dash="dash", line_color="black", opacity=0.3)
             st.plotly_chart(fig_change, use_container_width=True)
         
         with col_trend2:
@@ -695,44 +889,49 @@ def main():
                 st.metric("평균 월간 변화율", f"{avg_change:.2f}%")
     
     # --- 2. 금액별 분석 ---
-    with tab2:
+    elif active_tab == tab_names[2]:
         st.subheader("거래 금액대별 분포")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            # 히스토그램
-            fig2 = px.histogram(
-                filtered_df, 
-                x="거래금액(만원)", 
-                nbins=30, 
+            # 히스토그램 — 서버에서 구간 집계 후 30개 막대만 전송 (원본 N행 전송 방지)
+            prices = filtered_df['거래금액(만원)'].to_numpy()
+            counts, edges = np.histogram(prices, bins=30)
+            centers = (edges[:-1] + edges[1:]) / 2
+            fig2 = go.Figure(go.Bar(
+                x=centers,
+                y=counts,
+                width=np.diff(edges),
+                marker_color='#636EFA',
+            ))
+            fig2.update_layout(
                 title="거래 금액 분포 (히스토그램)",
-                color_discrete_sequence=['#636EFA']
+                xaxis_title="거래금액(만원)",
+                yaxis_title="건수",
             )
-            fig2.update_layout(xaxis_title="거래금액(만원)", yaxis_title="건수")
             # x축 금액 레이블을 한글로 변환
             max_price = filtered_df['거래금액(만원)'].max()
             fig2 = format_price_axis(fig2, axis='x', max_value=max_price)
             st.plotly_chart(fig2, use_container_width=True)
             
         with col2:
-            # Box Plot (이상치 확인용)
-            fig3 = px.box(
-                filtered_df, 
-                y="거래금액(만원)", 
-                title="거래 금액 범위 및 이상치 확인",
-                points="all"
-            )
+            # Box Plot (이상치 확인용) — 분위수만 서버에서 계산해 전송
+            q1, med, q3 = np.quantile(prices, [0.25, 0.5, 0.75]) if len(prices) else (0, 0, 0)
+            iqr = q3 - q1
+            fig3 = go.Figure(go.Box(
+                q1=[q1], median=[med], q3=[q3],
+                lowerfence=[max(float(prices.min()), q1 - 1.5 * iqr) if len(prices) else 0],
+                upperfence=[min(float(prices.max()), q3 + 1.5 * iqr) if len(prices) else 0],
+                name='거래금액(만원)',
+            ))
+            fig3.update_layout(title="거래 금액 범위 및 이상치 확인", yaxis_title="거래금액(만원)")
             # y축 금액 레이블을 한글로 변환
             max_price = filtered_df['거래금액(만원)'].max()
             fig3 = format_price_axis(fig3, axis='y', max_value=max_price)
             st.plotly_chart(fig3, use_container_width=True)
         
-        # 금액 구간별 통계
-        bins = [0, 50000, 100000, 150000, 200000, 300000, 9999999]
-        labels = ['5억 미만', '5억~10억', '10억~15억', '15억~20억', '20억~30억', '30억 이상']
-        filtered_df['금액구간'] = pd.cut(filtered_df['거래금액(만원)'], bins=bins, labels=labels)
-        
+        # 금액 구간별 통계 (금액구간은 preprocess_data에서 계산됨)
         price_group = filtered_df['금액구간'].value_counts().reset_index()
         price_group.columns = ['금액구간', '거래건수']
         
@@ -740,48 +939,52 @@ def main():
         st.plotly_chart(fig_pie, use_container_width=True)
     
     # --- 3. 면적별 분석 ---
-    with tab3:
+    elif active_tab == tab_names[3]:
         st.subheader("전용면적 및 평수별 가격 분석")
         
-        # 산점도 (면적 vs 가격)
-        fig4 = px.scatter(
-            filtered_df, 
-            x="전용면적(㎡)", 
-            y="거래금액(만원)", 
-            color="건축년도",
-            size="평수",
-            hover_data=['단지명', '층'],
+        # 산점도 (면적 vs 가격) — numpy 배열 + WebGL로 직렬화/렌더 비용 절감
+        # 15,000 포인트 초과 시 균일 표본만 전송 (집계/테이블은 전체 데이터 유지)
+        scatter_df = (filtered_df.sample(n=15000, random_state=0)
+                      if len(filtered_df) > 15000 else filtered_df)
+        scatter_size = scatter_df['평수'].to_numpy(dtype=np.float32)
+        scatter_custom = np.stack([
+            scatter_df['단지명'].to_numpy(dtype=object),
+            scatter_df['층'].to_numpy(dtype=object),
+        ], axis=-1)
+        fig4 = go.Figure(go.Scattergl(
+            x=scatter_df['전용면적(㎡)'].to_numpy(dtype=np.float32),
+            y=scatter_df['거래금액(만원)'].to_numpy(dtype=np.int32),
+            mode='markers',
+            marker=dict(
+                color=scatter_df['건축년도'].to_numpy(dtype='float32', na_value=np.nan),
+                colorscale='Viridis',
+                colorbar=dict(title='건축년도'),
+                size=scatter_size,
+                sizemode='area',
+                sizeref=2.0 * float(scatter_size.max()) / (20.0 ** 2) if len(scatter_size) else 1.0,
+            ),
+            customdata=scatter_custom,
+            hovertemplate=('전용면적(㎡)=%{x}<br>거래금액(만원)=%{y}<br>'
+                           '단지명=%{customdata[0]}<br>층=%{customdata[1]}<extra></extra>'),
+        ))
+        fig4.update_layout(
             title="전용면적 대 거래금액 산점도 (색상: 건축년도)",
-            color_continuous_scale=px.colors.sequential.Viridis
+            xaxis_title="전용면적(㎡)",
+            yaxis_title="거래금액(만원)",
         )
         # y축 금액 레이블을 한글로 변환
         max_price = filtered_df['거래금액(만원)'].max()
         fig4 = format_price_axis(fig4, axis='y', max_value=max_price)
         st.plotly_chart(fig4, use_container_width=True)
         
-        # 평형대 그룹화 분석
-        # 대략적인 평형 구분 (소형, 중소형, 중형, 대형)
-        def get_area_type(x):
-            if x < 60: return '소형(59㎡이하)'
-            elif x < 85: return '중소형(59~84㎡)'
-            elif x < 102: return '중형(85~102㎡)'
-            elif x < 135: return '중대형(102~135㎡)'
-            else: return '대형(135㎡초과)'
-            
-        filtered_df['평형구분'] = filtered_df['전용면적(㎡)'].apply(get_area_type)
-        
-        area_group = filtered_df.groupby('평형구분').agg({
-            '거래금액(만원)': 'mean', 
-            '평당가(만원)': 'mean',
-            'NO': 'count'
-        }).reset_index()
-        
-        # 순서 정렬
-        order_list = ['소형(59㎡이하)', '중소형(59~84㎡)', '중형(85~102㎡)', '중대형(102~135㎡)', '대형(135㎡초과)']
-        # 데이터에 존재하는 카테고리만 순서 목록에 포함
-        existing_categories = [cat for cat in order_list if cat in area_group['평형구분'].values]
-        area_group['평형구분'] = pd.Categorical(area_group['평형구분'], categories=existing_categories, ordered=True)
-        area_group = area_group.sort_values('평형구분')
+        # 평형대 그룹화 분석 (공유 집계 테이블 재사용, 이미 평형 순서)
+        area = summaries['area']
+        area_group = pd.DataFrame({
+            '평형구분': area.index,
+            '거래금액(만원)': area[('거래금액(만원)', 'mean')].to_numpy(),
+            '평당가(만원)': area[('평당가(만원)', 'mean')].to_numpy(),
+            '거래건수': area[('거래금액(만원)', 'count')].to_numpy(),
+        })
         
         fig5 = px.bar(
             area_group, 
@@ -798,11 +1001,12 @@ def main():
         st.plotly_chart(fig5, use_container_width=True)
     
     # --- 4. 입주년도(건축년도)별 분석 ---
-    with tab4:
+    elif active_tab == tab_names[4]:
         st.subheader("건축년도(연식)에 따른 가격 흐름")
         
-        # 건축년도별 평균 가격
-        year_stats = filtered_df.groupby('건축년도')['거래금액(만원)'].mean().reset_index()
+        # 건축년도별 평균 가격 (공유 집계 테이블 재사용)
+        year_stats = summaries['year'][('거래금액(만원)', 'mean')].reset_index()
+        year_stats.columns = ['건축년도', '거래금액(만원)']
         
         fig6 = px.line(
             year_stats, 
@@ -816,9 +1020,7 @@ def main():
         fig6 = format_price_axis(fig6, axis='y', max_value=max_price)
         st.plotly_chart(fig6, use_container_width=True)
         
-        # 구축 vs 신축 비교 (예: 2015년 기준)
-        filtered_df['건물유형'] = filtered_df['건축년도'].apply(lambda x: '신축(10년이내)' if x >= 2015 else '구축')
-        
+        # 구축 vs 신축 비교 (예: 2015년 기준, 건물유형은 preprocess_data에서 계산됨)
         fig7 = px.box(
             filtered_df,
             x='건물유형',
@@ -832,41 +1034,16 @@ def main():
         st.plotly_chart(fig7, use_container_width=True)
     
     # --- 5. 층수별 분석 ---
-    with tab5:
+    elif active_tab == tab_names[5]:
         st.subheader("층수에 따른 가격 분석")
         
-        # 층수 구간 분류 함수
-        def get_floor_category(floor):
-            if pd.isna(floor):
-                return '정보없음'
-            floor_num = int(floor) if isinstance(floor, (int, float)) else int(str(floor).replace('층', '').strip())
-            if floor_num <= 5:
-                return '저층(1~5층)'
-            elif floor_num <= 15:
-                return '중층(6~15층)'
-            elif floor_num <= 30:
-                return '고층(16~30층)'
-            else:
-                return '초고층(31층 이상)'
-        
-        filtered_df['층수구간'] = filtered_df['층'].apply(get_floor_category)
-        
+        # 층수구간은 preprocess_data에서 미리 계산됨
+
         # 층수 구간별 평균 가격
         col_floor1, col_floor2 = st.columns(2)
         
         with col_floor1:
-            floor_group = filtered_df.groupby('층수구간').agg({
-                '거래금액(만원)': 'mean',
-                '평당가(만원)': 'mean',
-                'NO': 'count'
-            }).reset_index()
-            floor_group.columns = ['층수구간', '평균거래금액', '평균평당가', '거래건수']
-            
-            # 순서 정렬
-            floor_order = ['저층(1~5층)', '중층(6~15층)', '고층(16~30층)', '초고층(31층 이상)', '정보없음']
-            existing_floor_cats = [cat for cat in floor_order if cat in floor_group['층수구간'].values]
-            floor_group['층수구간'] = pd.Categorical(floor_group['층수구간'], categories=existing_floor_cats, ordered=True)
-            floor_group = floor_group.sort_values('층수구간')
+            floor_group = compute_floor_group(filtered_df)
             
             fig_floor_bar = px.bar(
                 floor_group,
@@ -901,31 +1078,64 @@ def main():
         st.markdown("---")
         st.subheader("층수와 가격의 관계")
         
-        # 층수를 숫자로 변환
-        def extract_floor_num(floor):
-            if pd.isna(floor):
-                return None
-            try:
-                if isinstance(floor, (int, float)):
-                    return int(floor)
-                return int(str(floor).replace('층', '').strip())
-            except:
-                return None
-        
-        filtered_df['층수_숫자'] = filtered_df['층'].apply(extract_floor_num)
-        floor_scatter_df = filtered_df[filtered_df['층수_숫자'].notna()].copy()
-        
-        if len(floor_scatter_df) > 0:
-            fig_floor_scatter = px.scatter(
-                floor_scatter_df,
-                x='층수_숫자',
-                y='거래금액(만원)',
-                color='평당가(만원)',
-                size='전용면적(㎡)',
-                hover_data=['단지명', '건축년도'],
+        # 층수_숫자는 preprocess_data에서 계산됨
+        floor_scatter_df = filtered_df[filtered_df['층수_숫자'].notna()]
+        
+        if len(floor_scatter_df) > 20000:
+            # 초대형 결과는 서버에서 2D 히스토그램으로 집계 — 원본 좌표 대신
+            # 40x40 구간 카운트만 전송되어 payload가 상수 크기
+            # (px.density_heatmap은 원본 x/y 전체를 보내 브라우저에서 집계함)
+            counts, x_edges, y_edges = np.histogram2d(
+                floor_scatter_df['층수_숫자'].to_numpy(dtype=np.float32),
+                floor_scatter_df['거래금액(만원)'].to_numpy(dtype=np.float32),
+                bins=40,
+            )
+            fig_floor_scatter = go.Figure(go.Heatmap(
+                x=((x_edges[:-1] + x_edges[1:]) / 2).astype(np.float32),
+                y=((y_edges[:-1] + y_edges[1:]) / 2).astype(np.float32),
+                z=counts.T.astype(np.int32),
+                colorscale='Viridis',
+                colorbar=dict(title='거래 건수'),
+                hovertemplate=('층수=%{x:.0f}<br>거래금액(만원)=%{y:,.0f}<br>'
+                               '건수=%{z}<extra></extra>'),
+            ))
+            fig_floor_scatter.update_layout(
+                title='층수 vs 거래금액 분포 (밀도)',
+                xaxis_title='층수',
+                yaxis_title='거래금액(만원)',
+            )
+            fig_floor_scatter = format_price_axis(fig_floor_scatter, axis='y')
+            st.plotly_chart(fig_floor_scatter, use_container_width=True)
+        elif len(floor_scatter_df) > 0:
+            # WebGL + numpy 배열 — SVG 산점도는 수만 포인트에서 브라우저가 버거움
+            # 표본 축소는 그림에만 적용 (아래 프리미엄 통계는 전체 행 사용)
+            floor_plot_df = (floor_scatter_df.sample(n=15000, random_state=0)
+                             if len(floor_scatter_df) > 15000 else floor_scatter_df)
+            floor_size = floor_plot_df['전용면적(㎡)'].to_numpy(dtype=np.float32)
+            fig_floor_scatter = go.Figure(go.Scattergl(
+                x=floor_plot_df['층수_숫자'].to_numpy(dtype=np.int32),
+                y=floor_plot_df['거래금액(만원)'].to_numpy(dtype=np.int32),
+                mode='markers',
+                marker=dict(
+                    color=floor_plot_df['평당가(만원)'].to_numpy(dtype=np.float32),
+                    colorscale='Viridis',
+                    showscale=True,
+                    colorbar=dict(title='평당가(만원)'),
+                    size=floor_size,
+                    sizemode='area',
+                    sizeref=2.0 * float(floor_size.max()) / (20.0 ** 2),
+                ),
+                customdata=np.stack([
+                    floor_plot_df['단지명'].to_numpy(dtype=object),
+                    floor_plot_df['건축년도'].to_numpy(dtype=object),
+                ], axis=-1),
+                hovertemplate=('층수=%{x}<br>거래금액(만원)=%{y}<br>'
+                               '단지명=%{customdata[0]}<br>건축년도=%{customdata[1]}<extra></extra>'),
+            ))
+            fig_floor_scatter.update_layout(
                 title='층수 vs 거래금액 산점도',
-                labels={'층수_숫자': '층수', '거래금액(만원)': '거래금액(만원)'},
-                color_continuous_scale=px.colors.sequential.Viridis
+                xaxis_title='층수',
+                yaxis_title='거래금액(만원)',
             )
             # y축 금액 레이블을 한글로 변환
             max_price = floor_scatter_df['거래금액(만원)'].max()
@@ -962,15 +1172,7 @@ def main():
         with col_premium2:
             # 층수 구간별 통계 테이블
             st.markdown("#### 층수 구간별 상세 통계")
-            floor_stats = filtered_df.groupby('층수구간').agg({
-                '거래금액(만원)': ['count', 'mean', 'min', 'max'],
-                '평당가(만원)': 'mean'
-            }).reset_index()
-            floor_stats.columns = ['층수구간', '거래건수', '평균거래금액', '최저가', '최고가', '평균평당가']
-            floor_stats = floor_stats.sort_values('층수구간', key=lambda x: x.map({
-                '저층(1~5층)': 1, '중층(6~15층)': 2, '고층(16~30층)': 3, 
-                '초고층(31층 이상)': 4, '정보없음': 5
-            }))
+            floor_stats = compute_floor_stats(filtered_df)
             floor_stats['평균거래금액'] = floor_stats['평균거래금액'].round(0).astype(int)
             floor_stats['평균평당가'] = floor_stats['평균평당가'].round(0).astype(int)
             floor_stats['최저가'] = floor_stats['최저가'].round(0).astype(int)
@@ -978,16 +1180,11 @@ def main():
             st.dataframe(floor_stats, use_container_width=True, hide_index=True)
     
     # --- 6. 지역별 비교 분석 ---
-    with tab6:
+    elif active_tab == tab_names[6]:
         st.subheader("지역별 비교 분석")
         
-        # 지역별 평균 거래금액 비교
-        region_comparison = filtered_df.groupby('시군구').agg({
-            '거래금액(만원)': ['mean', 'count'],
-            '평당가(만원)': 'mean'
-        }).reset_index()
-        region_comparison.columns = ['시군구', '평균거래금액', '거래건수', '평균평당가']
-        region_comparison = region_comparison.sort_values('평균거래금액', ascending=False)
+        # 지역별 평균 거래금액 비교 (캐시된 집계)
+        region_comparison = compute_region_comparison(filtered_df)
         
         col_region1, col_region2 = st.columns(2)
         
@@ -1051,15 +1248,16 @@ def main():
         st.dataframe(region_comparison, use_container_width=True, hide_index=True)
     
     # --- 7. 단지별 분석 ---
-    with tab7:
+    elif active_tab == tab_names[7]:
         st.subheader("아파트 단지별 거래 순위")
         
+        # 순위 테이블은 캐시된 집계에서 한 번에 가져옴
+        top_vol_apt, top_price_apt, top_pyeong_apt, price_stats = compute_complex_rankings(filtered_df)
+        
         col_apt1, col_apt2 = st.columns(2)
         
         with col_apt1:
             st.markdown("**🏆 거래량 상위 10개 단지**")
-            top_vol_apt = filtered_df['단지명'].value_counts().head(10).reset_index()
-            top_vol_apt.columns = ['단지명', '거래건수']
             
             fig8 = px.bar(
                 top_vol_apt, 
@@ -1074,7 +1272,6 @@ def main():
             
         with col_apt2:
             st.markdown("**💰 평균 거래가 상위 10개 단지**")
-            top_price_apt = filtered_df.groupby('단지명')['거래금액(만원)'].mean().sort_values(ascending=False).head(10).reset_index()
             
             fig9 = px.bar(
                 top_price_apt, 
@@ -1094,8 +1291,6 @@ def main():
         # 평당가 상위 10개 단지
         st.markdown("---")
         st.markdown("**📊 평당가 상위 10개 단지**")
-        top_pyeong_apt = filtered_df.groupby('단지명')['평당가(만원)'].mean().sort_values(ascending=False).head(10).reset_index()
-        top_pyeong_apt.columns = ['단지명', '평당가(만원)']
         
         fig10 = px.bar(
             top_pyeong_apt,
@@ -1116,37 +1311,11 @@ def main():
         st.markdown("---")
         st.markdown("**📈 단지별 가격 범위 비교 (최고가/최저가)**")
         
-        # 거래량 상위 10개 단지 선택
-        top_10_complexes = filtered_df['단지명'].value_counts().head(10).index.tolist()
-        price_range_df = filtered_df[filtered_df['단지명'].isin(top_10_complexes)].copy()
-        
-        # 각 단지별 최고가, 최저가, 평균가 계산
-        price_stats = price_range_df.groupby('단지명')['거래금액(만원)'].agg(['min', 'max', 'mean']).reset_index()
-        price_stats.columns = ['단지명', '최저가', '최고가', '평균가']
-        price_stats = price_stats.sort_values('평균가', ascending=False)
+        # price_stats는 위에서 캐시된 집계로 계산됨 (거래량 상위 10개 단지 기준)
         
-        # 범위 막대 차트 생성 (최저가부터 최고가까지의 범위와 평균가 표시)
-        fig11 = go.Figure()
-        
-        # 최저가부터 최고가까지의 범위를 표시하는 막대
-        fig11.add_trace(go.Bar(
-            name='가격 범위',
-            x=price_stats['단지명'],
-            y=price_stats['최고가'] - price_stats['최저가'],  # 범위 길이
-            base=price_stats['최저가'],  # 최저가부터 시작
-            marker=dict(
-                color='lightblue',
-                line=dict(color='blue', width=1)
-            ),
-            hovertemplate='<b>%{x}</b><br>' +
-                         '최저가: %{base:,.0f}만원<br>' +
-                         '최고가: %{customdata:,.0f}만원<br>' +
-                         '범위: %{y:,.0f}만원<extra></extra>',
-            customdata=price_stats['최고가']
-        ))
-        
-        # 평균가 마커 추가
-        fig11.add_trace(go.Scatter(
+        # 범위 차트: 평균가 마커 하나에 비대칭 오차 막대로 최저~최고 범위 표시
+        # (막대 + 마커 두 트레이스 대신 단일 트레이스 — 직렬화/DOM 비용 절반)
+        fig11 = go.Figure(go.Scatter(
             x=price_stats['단지명'],
             y=price_stats['평균가'],
             mode='markers',
@@ -1156,8 +1325,20 @@ def main():
                 color='red',
                 line=dict(color='darkred', width=2)
             ),
-            name='평균가',
-            hovertemplate='<b>%{x}</b><br>평균가: %{y:,.0f}만원<extra></extra>'
+            error_y=dict(
+                type='data',
+                symmetric=False,
+                array=price_stats['최고가'] - price_stats['평균가'],
+                arrayminus=price_stats['평균가'] - price_stats['최저가'],
+                color='blue',
+                thickness=2,
+                width=8
+            ),
+            name='평균가 (범위: 최저~최고)',
+            customdata=np.stack([price_stats['최저가'], price_stats['최고가']], axis=-1),
+            hovertemplate='<b>%{x}</b><br>평균가: %{y:,.0f}만원<br>' +
+                          '최저가: %{customdata[0]:,.0f}만원<br>' +
+                          '최고가: %{customdata[1]:,.0f}만원<extra></extra>'
         ))
         
         fig11.update_layout(
@@ -1166,8 +1347,7 @@ def main():
             yaxis_title='거래금액(만원)',
             xaxis=dict(tickangle=-45),
             hovermode='closest',
-            height=600,
-            barmode='overlay'
+            height=600
         )
         
         # y축 금액 레이블을 한글로 변환
@@ -1177,15 +1357,22 @@ def main():
         
         st.markdown("### 📋 전체 데이터 조회")
         # 표시용 데이터프레임 생성 (정렬 후 계약년월을 한글 형식으로 변환)
-        display_df = filtered_df[['시군구', '단지명', '전용면적(㎡)', '계약년월', '계약일', '거래금액(만원)', '층', '건축년도']].copy()
+        display_df = filtered_df[['시군구', '단지명', '전용면적(㎡)', '계약년월', '계약일', '거래금액(만원)', '층', '건축년도']]
         # 먼저 정렬 (원본 숫자 형식으로)
         display_df = display_df.sort_values(by=['계약년월', '계약일'], ascending=False)
+        # 기본은 최근 1,000건만 브라우저로 전송 — 전체 행을 실으면 이 표가
+        # 탭 렌더 시간을 지배함. 필요할 때만 전체 표시를 선택
+        show_all = st.checkbox(
+            f"전체 {len(display_df):,}건 모두 표시", value=False,
+            disabled=len(display_df) <= 1000)
+        if not show_all:
+            display_df = display_df.head(1000)
         # 표시용으로 계약년월 변환
-        display_df['계약년월'] = display_df['계약년월'].apply(format_contract_yearmonth)
+        display_df['계약년월'] = yearmonth_series_korean(display_df['계약년월'])
         st.dataframe(display_df, use_container_width=True, hide_index=True)
     
     # --- 8. 신고가 추세 분석 ---
-    with tab8:
+    elif active_tab == tab_names[8]:
         st.subheader("📈 신고가 추세 분석")
         st.markdown("과거 거래가와 현재 거래가를 비교하여 가격 상승 추세를 분석합니다.")
         
@@ -1213,79 +1400,38 @@ def main():
         current_date = filtered_df['거래일자'].max()
         past_date = current_date - pd.DateOffset(months=period_months)
         
-        # 현재 기간과 과거 기간 데이터 분리
-        current_period_df = filtered_df[filtered_df['거래일자'] > past_date].copy()
-        past_period_df = filtered_df[filtered_df['거래일자'] <= past_date].copy()
+        # 비교 조건에 따른 그룹화 키 — 행별 apply 대신 전처리된 구간 컬럼을 이어붙여 생성
+        # (현재/과거로 나누기 전에 한 번만 계산해 두 조각이 공유)
+        group_key = filtered_df['단지명'].astype(str)
+        if comparison_criteria != "같은 단지":
+            group_key = group_key + '_' + filtered_df['평형구분'].astype(str)
+        if comparison_criteria == "같은 단지 + 면적대 + 층수대":
+            group_key = group_key + '_' + filtered_df['층수구간'].astype(str)
+        # 문자열 그대로 두지 않고 categorical로 — 그룹 해시가 int 코드 기반이 됨
+        filtered_df['그룹키'] = pd.Categorical(group_key)
+        
+        # 현재 기간과 과거 기간 데이터 분리 (CoW로 분리되므로 명시적 copy 불필요)
+        current_period_df = filtered_df[filtered_df['거래일자'] > past_date]
+        past_period_df = filtered_df[filtered_df['거래일자'] <= past_date]
         
         if len(past_period_df) == 0:
             st.warning(f"{comparison_period} 이전 데이터가 없어 분석할 수 없습니다.")
         else:
             st.info(f"현재 기간: {len(current_period_df):,}건 | 과거 기간: {len(past_period_df):,}건")
             
-            # 비교 조건에 따른 그룹화 키 생성
-            def get_group_key(row, criteria):
-                """비교 조건에 따라 그룹화 키 생성"""
-                if criteria == "같은 단지":
-                    return row['단지명']
-                elif criteria == "같은 단지 + 면적대":
-                    # 면적대 구분
-                    area = row['전용면적(㎡)']
-                    if area < 60:
-                        area_type = '소형'
-                    elif area < 85:
-                        area_type = '중소형'
-                    elif area < 102:
-                        area_type = '중형'
-                    elif area < 135:
-                        area_type = '중대형'
-                    else:
-                        area_type = '대형'
-                    return f"{row['단지명']}_{area_type}"
-                else:  # 같은 단지 + 면적대 + 층수대
-                    # 면적대 구분
-                    area = row['전용면적(㎡)']
-                    if area < 60:
-                        area_type = '소형'
-                    elif area < 85:
-                        area_type = '중소형'
-                    elif area < 102:
-                        area_type = '중형'
-                    elif area < 135:
-                        area_type = '중대형'
-                    else:
-                        area_type = '대형'
-                    # 층수대 구분
-                    try:
-                        floor = int(str(row['층']).replace('층', '').strip()) if pd.notna(row['층']) else 0
-                        if floor <= 5:
-                            floor_type = '저층'
-                        elif floor <= 15:
-                            floor_type = '중층'
-                        elif floor <= 30:
-                            floor_type = '고층'
-                        else:
-                            floor_type = '초고층'
-                    except:
-                        floor_type = '기타'
-                    return f"{row['단지명']}_{area_type}_{floor_type}"
-            
-            # 비교 조건에 따라 그룹화 키 추가
-            current_period_df['그룹키'] = current_period_df.apply(lambda x: get_group_key(x, comparison_criteria), axis=1)
-            past_period_df['그룹키'] = past_period_df.apply(lambda x: get_group_key(x, comparison_criteria), axis=1)
-            
             # 1. 단지별 가격 상승 추세 분석
             st.markdown("---")
             st.subheader(f"가격 상승 추세 분석 ({comparison_criteria})")
             
-            # 그룹별 평균 가격 계산
-            current_avg = current_period_df.groupby('그룹키')['거래금액(만원)'].mean().reset_index()
-            current_avg.columns = ['그룹키', '현재평균가']
-            
-            past_avg = past_period_df.groupby('그룹키')['거래금액(만원)'].mean().reset_index()
-            past_avg.columns = ['그룹키', '과거평균가']
-            
-            # 병합하여 상승률 계산
-            price_comparison = current_avg.merge(past_avg, on='그룹키', how='inner')
+            # 그룹별 평균 가격 — 현재/과거 플래그를 붙여 한 번의 groupby로 계산
+            # (조각별 groupby 두 번 + merge 해시 구축을 단일 스캔으로 대체)
+            is_current = (filtered_df['거래일자'] > past_date).rename('현재여부')
+            avg_by_period = filtered_df.groupby(
+                ['그룹키', is_current], observed=True
+            )['거래금액(만원)'].mean().unstack('현재여부')
+            # 양쪽 기간 모두 거래가 있는 그룹만 비교 (기존 inner merge와 동일)
+            price_comparison = avg_by_period.dropna().reset_index()
+            price_comparison.columns = ['그룹키', '과거평균가', '현재평균가']
             price_comparison['상승률(%)'] = ((price_comparison['현재평균가'] - price_comparison['과거평균가']) / price_comparison['과거평균가']) * 100
             price_comparison['상승금액'] = price_comparison['현재평균가'] - price_comparison['과거평균가']
             
@@ -1350,36 +1496,16 @@ def main():
             # 분석 단위 선택
             analysis_unit = st.radio("분석 단위", ["월별", "분기별"], horizontal=True)
             
-            if analysis_unit == "월별":
-                # 월별 평균 가격 계산
-                current_period_df['년월'] = current_period_df['거래일자'].dt.to_period('M').astype(str)
-                past_period_df['년월'] = past_period_df['거래일자'].dt.to_period('M').astype(str)
-                
-                monthly_current = current_period_df.groupby('년월')['거래금액(만원)'].mean().reset_index()
-                monthly_current.columns = ['기간', '평균가']
-                monthly_current['기간_한글'] = monthly_current['기간'].apply(format_yearmonth_korean)
-                
-                monthly_past = past_period_df.groupby('년월')['거래금액(만원)'].mean().reset_index()
-                monthly_past.columns = ['기간', '평균가']
-                monthly_past['기간_한글'] = monthly_past['기간'].apply(format_yearmonth_korean)
-                
-                period_data = monthly_current.copy()
-                period_label = '년월'
+            # 월별/분기별은 주기 문자 하나만 다른 같은 집계 — 한 경로로 통합
+            freq = 'M' if analysis_unit == "월별" else 'Q'
+            period_key = current_period_df['거래일자'].dt.to_period(freq).astype(str)
+            period_data = current_period_df.groupby(period_key)['거래금액(만원)'].mean().reset_index()
+            period_data.columns = ['기간', '평균가']
+            if freq == 'M':
+                period_data['기간_한글'] = yearmonth_series_korean(period_data['기간'])
             else:
-                # 분기별 평균 가격 계산
-                current_period_df['분기'] = current_period_df['거래일자'].dt.to_period('Q').astype(str)
-                past_period_df['분기'] = past_period_df['거래일자'].dt.to_period('Q').astype(str)
-                
-                quarterly_current = current_period_df.groupby('분기')['거래금액(만원)'].mean().reset_index()
-                quarterly_current.columns = ['기간', '평균가']
-                quarterly_current['기간_한글'] = quarterly_current['기간'].apply(lambda x: f"{x[:4]}년 {int(x[-1])}분기")
-                
-                quarterly_past = past_period_df.groupby('분기')['거래금액(만원)'].mean().reset_index()
-                quarterly_past.columns = ['기간', '평균가']
-                quarterly_past['기간_한글'] = quarterly_past['기간'].apply(lambda x: f"{x[:4]}년 {int(x[-1])}분기")
-                
-                period_data = quarterly_current.copy()
-                period_label = '분기'
+                s = period_data['기간'].astype('string')
+                period_data['기간_한글'] = s.str.slice(0, 4) + '년 ' + s.str.slice(-1) + '분기'
             
             # 과거 기간의 평균 가격 (기준선)
             past_avg_price = past_period_df['거래금액(만원)'].mean()
@@ -1435,29 +1561,21 @@ def main():
             st.subheader("신고가 프리미엄 분석")
             st.markdown(f"과거 평균가 대비 현재 거래가의 프리미엄을 분석합니다. (비교 조건: {comparison_criteria})")
             
-            # 각 거래의 프리미엄 계산 (비교 조건에 따라)
-            premium_data = []
-            for idx, row in current_period_df.iterrows():
-                group_key = row['그룹키']
-                current_price = row['거래금액(만원)']
-                
-                # 같은 그룹의 과거 평균가
-                past_group_avg = past_period_df[past_period_df['그룹키'] == group_key]['거래금액(만원)'].mean()
-                
-                if pd.notna(past_group_avg) and past_group_avg > 0:
-                    premium = current_price - past_group_avg
-                    premium_rate = (premium / past_group_avg) * 100
-                    premium_data.append({
-                        '단지명': row['단지명'],
-                        '거래금액': current_price,
-                        '과거평균가': past_group_avg,
-                        '프리미엄': premium,
-                        '프리미엄률(%)': premium_rate,
-                        '거래일자': row['거래일자']
-                    })
+            # 각 거래의 프리미엄 계산 — 그룹별 과거 평균을 한 번 구해 map으로 결합
+            # (행마다 과거 조각을 다시 필터링하던 O(N·G) 루프 제거)
+            past_group_avg = past_period_df.groupby('그룹키', observed=True, sort=False)['거래금액(만원)'].mean()
+            premium_df = pd.DataFrame({
+                '단지명': current_period_df['단지명'],
+                '거래금액': current_period_df['거래금액(만원)'],
+                # categorical.map은 categorical을 돌려주므로 float로 되돌림
+                '과거평균가': current_period_df['그룹키'].map(past_group_avg).astype('float64'),
+                '거래일자': current_period_df['거래일자'],
+            })
+            premium_df = premium_df[premium_df['과거평균가'] > 0]
+            premium_df['프리미엄'] = premium_df['거래금액'] - premium_df['과거평균가']
+            premium_df['프리미엄률(%)'] = premium_df['프리미엄'] / premium_df['과거평균가'] * 100
             
-            if premium_data:
-                premium_df = pd.DataFrame(premium_data)
+            if len(premium_df) > 0:
                 
                 col_premium1, col_premium2 = st.columns(2)
                 
@@ -1503,7 +1621,7 @@ def main():
                 st.markdown("---")
                 st.subheader("시간별 프리미엄 추이")
                 premium_df['년월'] = premium_df['거래일자'].dt.to_period('M').astype(str)
-                premium_df['년월_한글'] = premium_df['년월'].apply(format_yearmonth_korean)
+                premium_df['년월_한글'] = yearmonth_series_korean(premium_df['년월'])
                 
                 monthly_premium = premium_df.groupby('년월_한글').agg({
                     '프리미엄': 'mean',
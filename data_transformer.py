@@ -9,11 +9,22 @@ and data structures compared to the legacy format. This module provides
 transparent transformation to maintain backward compatibility.
 """
 
+import numpy as np
 import pandas as pd
 import warnings
+from functools import lru_cache
 from typing import Literal
 
-from region_code_mapper import get_sigungu_name
+from region_code_mapper import map_region_codes, report_unknown_codes
+
+# pyarrow-backed string columns make the .str kernels in
+# transform_to_legacy run over contiguous UTF-8 buffers instead of
+# per-element Python objects; fall back gracefully when unavailable.
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
 
 
 # Column mapping from new API format to legacy format
@@ -45,6 +56,27 @@ LEGACY_COLUMNS = {
 }
 
 
+# Output schema of transform_to_legacy, column order included; empty
+# inputs short-circuit to a frame predeclared with these dtypes.
+_LEGACY_SCHEMA = {
+    "NO": "int32",
+    "시군구": "string",
+    "단지명": "string",
+    "전용면적(㎡)": "float32",
+    "계약년월": "int32",
+    "계약일": "int64",
+    "거래금액(만원)": "int32",
+    "층": "Int16",
+    "건축년도": "Int16",
+    "해제사유발생일": "string",
+}
+
+# Indicator columns checked by detect_format, frozen at module load so
+# detection allocates nothing on the hot path.
+_LEGACY_INDICATORS = ("시군구", "단지명", "거래금액(만원)")
+_NEW_API_INDICATORS = ("sggCd", "aptNm", "dealAmount")
+
+
 def detect_format(df: pd.DataFrame) -> Literal["old", "new"]:
     """
     Detect the format of the input DataFrame.
@@ -70,20 +102,27 @@ def detect_format(df: pd.DataFrame) -> Literal["old", "new"]:
         >>> detect_format(df_new)
         'new'
     """
-    columns = set(df.columns)
+    # Memoized on the column signature, so repeated detection over
+    # chunked reads of the same schema is a single dict lookup.
+    return _format_for_columns(tuple(df.columns))
+
+
+@lru_cache(maxsize=32)
+def _format_for_columns(columns: tuple) -> Literal["old", "new"]:
+    """Resolve the format for one column signature; see detect_format."""
+    # Checking indicators against a small tuple short-circuits on the
+    # first miss without building a set.
 
     # Check for legacy format indicators
-    legacy_indicators = {"시군구", "단지명", "거래금액(만원)"}
-    if legacy_indicators.issubset(columns):
+    if all(col in columns for col in _LEGACY_INDICATORS):
         return "old"
 
     # Check for new API format indicators
-    new_api_indicators = {"sggCd", "aptNm", "dealAmount"}
-    if new_api_indicators.issubset(columns):
+    if all(col in columns for col in _NEW_API_INDICATORS):
         return "new"
 
     # If neither format is detected, raise an error with helpful message
-    available_cols = ", ".join(sorted(columns)[:10])
+    available_cols = ", ".join(sorted(map(str, columns))[:10])
     if len(columns) > 10:
         available_cols += f", ... ({len(columns) - 10} more)"
 
@@ -95,7 +134,7 @@ def detect_format(df: pd.DataFrame) -> Literal["old", "new"]:
     )
 
 
-def transform_to_legacy(df: pd.DataFrame) -> pd.DataFrame:
+def transform_to_legacy(df: pd.DataFrame, chunk_size: int = 200_000) -> pd.DataFrame:
     """
     Transform new MOLIT API format DataFrame to legacy format.
 
@@ -111,8 +150,13 @@ def transform_to_legacy(df: pd.DataFrame) -> pd.DataFrame:
     - 건축년도: Direct mapping from buildYear
     - 해제사유발생일: Direct mapping from cdealDay
 
+    Large frames are processed in row batches of ``chunk_size`` so the
+    string intermediates never hold more than one batch at a time,
+    bounding peak memory during the transform.
+
     Args:
         df: DataFrame in new MOLIT API format
+        chunk_size: Maximum number of rows transformed per batch
 
     Returns:
         DataFrame transformed to legacy format
@@ -131,94 +175,102 @@ def transform_to_legacy(df: pd.DataFrame) -> pd.DataFrame:
             f"Available columns: {list(df.columns)}"
         )
 
-    # Create a new DataFrame for the transformed data
-    result = pd.DataFrame()
-
-    # 1. NO: Generate 1-based row numbers
-    result["NO"] = range(1, len(df) + 1)
-
-    # 2. 시군구: Combine region code lookup with dong name
-    result["시군구"] = df.apply(_generate_sigungu, axis=1)
-
-    # 3. 단지명: Direct mapping
-    result["단지명"] = df["aptNm"]
-
-    # 4. 전용면적(㎡): Direct mapping (ensure numeric)
-    result["전용면적(㎡)"] = pd.to_numeric(df["excluUseAr"], errors="coerce")
-
-    # 5. 계약년월: Combine year and month as YYYYMM
-    result["계약년월"] = df.apply(_generate_contract_yearmonth, axis=1)
-
-    # 6. 계약일: Direct mapping
-    result["계약일"] = df["dealDay"]
-
-    # 7. 거래금액(만원): Remove commas and convert to integer
-    result["거래금액(만원)"] = df["dealAmount"].apply(_clean_deal_amount)
-
-    # 8. 층: Direct mapping
-    result["층"] = df["floor"]
-
-    # 9. 건축년도: Direct mapping
-    result["건축년도"] = df["buildYear"]
-
-    # 10. 해제사유발생일: Direct mapping (handle missing column)
-    if "cdealDay" in df.columns:
-        result["해제사유발생일"] = df["cdealDay"].fillna("")
-    else:
-        result["해제사유발생일"] = ""
-
+    # Empty input: hand back a correctly-typed empty frame without
+    # running any of the column kernels.
+    if len(df) == 0:
+        return pd.DataFrame({col: pd.Series(dtype=dtype)
+                             for col, dtype in _LEGACY_SCHEMA.items()})
+
+    if len(df) <= chunk_size:
+        return _transform_block(df)
+
+    # Tile over row ranges and stitch the blocks back together; the
+    # 1-based NO numbering is rebuilt globally after the concat.
+    blocks = [_transform_block(df.iloc[start:start + chunk_size])
+              for start in range(0, len(df), chunk_size)]
+    result = pd.concat(blocks, ignore_index=True)
+    result["NO"] = np.arange(1, len(result) + 1, dtype=np.int32)
     return result
 
 
-def _generate_sigungu(row: pd.Series) -> str:
-    """
-    Generate the 시군구 field by combining region name lookup with dong name.
-
-    Args:
-        row: A row from the DataFrame
-
-    Returns:
-        Combined string like "서울특별시 은평구 불광동"
-    """
-    sgg_code = row.get("sggCd", "")
-    umd_name = row.get("umdNm", "")
-
-    # Get region name from code
-    region_name = get_sigungu_name(sgg_code)
-
-    # Combine with dong name if available
-    if umd_name and pd.notna(umd_name):
-        return f"{region_name} {str(umd_name).strip()}"
-
-    return region_name
-
-
-def _generate_contract_yearmonth(row: pd.Series) -> int:
-    """
-    Generate the 계약년월 field as YYYYMM format.
-
-    Args:
-        row: A row from the DataFrame
+def _transform_block(df: pd.DataFrame) -> pd.DataFrame:
+    """Transform one batch of rows; see transform_to_legacy."""
+    # Normalize the string-heavy columns to a real string dtype up front
+    # (Arrow-backed when pyarrow is installed) so every .str operation
+    # below runs on packed buffers rather than object arrays.
+    string_dtype = "string[pyarrow]" if _HAS_PYARROW else "string"
+    str_cols = [c for c in ("sggCd", "umdNm", "aptNm", "dealAmount")
+                if c in df.columns]
+    df = df.astype(dict.fromkeys(str_cols, string_dtype))
+
+    # 시군구: Combine region code lookup with dong name (vectorized;
+    # unknown codes are kept as-is and warned once per process).
+    # Branchless select: concatenate once for the whole column and fall
+    # back to the bare region name wherever the dong name is empty.
+    sgg_str = df["sggCd"].str.split(".", n=1).str[0].str.strip()
+    region = map_region_codes(sgg_str)
+    report_unknown_codes(sgg_str[region.isna() & (sgg_str != "")].dropna())
+    region = region.fillna(sgg_str)
+    umd = df["umdNm"].fillna("").str.strip()
+    sigungu = np.where(umd != "", region + " " + umd, region)
+
+    # 계약년월: Combine year and month as YYYYMM (integer arithmetic on
+    # whole columns; parse failures become 0 with one aggregated warning)
+    yearmonth = (pd.to_numeric(df["dealYear"], errors="coerce") * 100
+                 + pd.to_numeric(df["dealMonth"], errors="coerce"))
+    n_bad = int(yearmonth.isna().sum())
+    if n_bad:
+        warnings.warn(
+            f"Failed to parse year/month on {n_bad} row(s). Using 0.",
+            UserWarning
+        )
 
-    Returns:
-        Contract year-month as integer in YYYYMM format (e.g., 202407)
-    """
-    try:
-        year = int(row.get("dealYear", 0))
-        month = int(row.get("dealMonth", 0))
-        return year * 100 + month
-    except (ValueError, TypeError):
+    # 거래금액(만원): Remove commas and convert to integer (vectorized
+    # string kernel; unparseable values become 0 with one aggregated warning)
+    amount_str = df["dealAmount"].str.replace(",", "", regex=False).str.strip()
+    amounts = pd.to_numeric(amount_str, errors="coerce")
+    bad_amounts = amounts.isna() & df["dealAmount"].notna()
+    if bad_amounts.any():
         warnings.warn(
-            f"Failed to parse year/month: {row.get('dealYear')}/{row.get('dealMonth')}",
+            f"Failed to parse deal amount on {int(bad_amounts.sum())} row(s). "
+            f"Using 0.",
             UserWarning
         )
-        return 0
+
+    # 해제사유발생일: one np.where pass over the raw array instead of a
+    # fillna round-trip (handle missing column)
+    if "cdealDay" in df.columns:
+        cdeal = df["cdealDay"].to_numpy(copy=False)
+        cancel_date = np.where(pd.isna(cdeal), "", cdeal)
+    else:
+        cancel_date = ""
+
+    # Assemble the result in one constructor call so the block manager
+    # is built once instead of being consolidated per column. Numeric
+    # columns take the narrowest dtype their range needs (areas top out
+    # near 500㎡, amounts and YYYYMM fit int32, floors/years in int16),
+    # fixed per column so chunked blocks always concat cleanly.
+    return pd.DataFrame({
+        "NO": np.arange(1, len(df) + 1, dtype=np.int32),
+        "시군구": sigungu,
+        "단지명": df["aptNm"],
+        "전용면적(㎡)": pd.to_numeric(df["excluUseAr"], errors="coerce").astype("float32"),
+        "계약년월": yearmonth.fillna(0).astype("int32"),
+        "계약일": df["dealDay"],
+        "거래금액(만원)": amounts.fillna(0).astype("int32"),
+        "층": pd.to_numeric(df["floor"], errors="coerce").astype("Int16"),
+        "건축년도": pd.to_numeric(df["buildYear"], errors="coerce").astype("Int16"),
+        "해제사유발생일": cancel_date,
+    }, index=df.index)
 
 
 def _clean_deal_amount(value) -> int:
     """
     Clean the deal amount by removing commas and converting to integer.
 
+    Kept as a scalar fallback; transform_to_legacy uses the vectorized
+    equivalent for whole columns.
+
     Args:
         value: The deal amount value (may contain commas)
 
@@ -247,6 +299,11 @@ def auto_transform(df: pd.DataFrame) -> pd.DataFrame:
     This is a convenience function that combines format detection and
     transformation into a single call.
 
+    Callers loading from Excel should prefer
+    pd.read_excel(..., engine="calamine"): the Rust-based parser is
+    several times faster and far lighter on memory than openpyxl for
+    multi-100k-row workbooks, and the transform is I/O dominated.
+
     Args:
         df: DataFrame loaded from an Excel file (any format)
 
@@ -257,6 +314,11 @@ def auto_transform(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If the format cannot be determined
     """
+    # Fast path: the most distinctive legacy column is a single hash
+    # lookup away, so already-legacy files skip detection entirely.
+    if "거래금액(만원)" in df.columns:
+        return df
+
     file_format = detect_format(df)
 
     if file_format == "old":
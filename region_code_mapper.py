@@ -8,9 +8,13 @@ Reference: https://www.code.go.kr (Administrative Standard Code Management Syste
 Region codes are the first 5 digits of the 10-digit legal dong code.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 import warnings
 
+import numpy as np
+import pandas as pd
+
 
 # Seoul metropolitan area region codes (5-digit sggCd)
 # Format: {region_code: "시도명 시군구명"}
@@ -44,6 +48,60 @@ REGION_CODE_MAP: Dict[str, str] = {
 }
 
 
+# Parallel code/name arrays for the categorical fast path in
+# map_region_codes: factorizing against 25 known categories turns the
+# name lookup into a single pointer-array gather.
+_REGION_CODES = list(REGION_CODE_MAP)
+_REGION_NAMES = np.array(list(REGION_CODE_MAP.values()), dtype=object)
+
+# Unknown codes already reported in this process. Warning once per
+# unique code keeps bulk transforms from walking the warnings filter
+# chain for every row.
+_MISSING_CODES: set = set()
+
+
+def report_unknown_codes(codes) -> None:
+    """
+    Warn once per process for each region code missing from the mapping.
+
+    Args:
+        codes: Iterable of normalized code strings that failed lookup.
+               Codes already reported in this process are ignored.
+    """
+    new_codes = sorted(set(codes) - _MISSING_CODES)
+    if not new_codes:
+        return
+    _MISSING_CODES.update(new_codes)
+    warnings.warn(
+        f"Region codes not found in mapping table: {new_codes}. "
+        f"Using codes as-is. Consider updating REGION_CODE_MAP.",
+        UserWarning
+    )
+
+
+def map_region_codes(codes: pd.Series) -> pd.Series:
+    """
+    Vectorized lookup of region names for a whole column of codes.
+
+    Args:
+        codes: Series of 5-digit region codes (str, int, or float).
+               Float artifacts like 11380.0 are normalized first.
+
+    Returns:
+        Series of region names aligned with the input index. Codes not
+        present in the mapping table come back as NaN, so callers can
+        pick their own fallback (e.g., keep the code as-is).
+    """
+    code_str = codes.astype(str).str.split(".", n=1).str[0].str.strip()
+    # Mask codes outside the category list before factorizing: pandas
+    # deprecated constructing a Categorical from out-of-category values,
+    # and non-Seoul files hit that on every block.
+    known = code_str.where(code_str.isin(_REGION_CODES))
+    cat = pd.Categorical(known, categories=_REGION_CODES)
+    names = np.where(cat.codes >= 0, _REGION_NAMES[cat.codes], None)
+    return pd.Series(names, index=codes.index)
+
+
 def get_sigungu_name(code: str) -> str:
     """
     Convert a 5-digit region code to its corresponding region name.
@@ -67,35 +125,35 @@ def get_sigungu_name(code: str) -> str:
     if code is None:
         return ""
 
-    # Ensure code is a string and strip whitespace
-    code_str = str(code).strip()
-
-    # Handle potential float conversion issues (e.g., 11380.0 -> 11380)
-    if "." in code_str:
-        code_str = code_str.split(".")[0]
+    # Ensure code is a string and strip whitespace; partition trims
+    # float artifacts (e.g., 11380.0 -> 11380) without the list
+    # allocation split() would make.
+    code_str = str(code).strip().partition(".")[0]
 
     # Look up the region name
     region_name = REGION_CODE_MAP.get(code_str)
 
     if region_name is None:
-        warnings.warn(
-            f"Region code '{code_str}' not found in mapping table. "
-            f"Using code as-is. Consider updating REGION_CODE_MAP.",
-            UserWarning
-        )
+        report_unknown_codes((code_str,))
         return code_str
 
     return region_name
 
 
-def get_all_region_codes() -> Dict[str, str]:
+# Read-only view handed out by get_all_region_codes; built once so the
+# accessor allocates nothing per call.
+_REGION_VIEW: Mapping[str, str] = MappingProxyType(REGION_CODE_MAP)
+
+
+def get_all_region_codes() -> Mapping[str, str]:
     """
     Get all available region codes and their names.
 
     Returns:
-        Dictionary of region codes to region names.
+        Read-only mapping of region codes to region names. Callers that
+        need a mutable copy should wrap it in dict(...).
     """
-    return REGION_CODE_MAP.copy()
+    return _REGION_VIEW
 
 
 def is_valid_region_code(code: str) -> bool:
@@ -111,8 +169,4 @@ def is_valid_region_code(code: str) -> bool:
     if code is None:
         return False
 
-    code_str = str(code).strip()
-    if "." in code_str:
-        code_str = code_str.split(".")[0]
-
-    return code_str in REGION_CODE_MAP
+    return str(code).strip().partition(".")[0] in REGION_CODE_MAP
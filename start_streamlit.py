@@ -8,10 +8,11 @@ import socket
 
 def check_port(port):
     """포트가 열려있는지 확인"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = sock.connect_ex(('localhost', port))
-    sock.close()
-    return result == 0
+    try:
+        socket.create_connection(('localhost', port), timeout=0.05).close()
+        return True
+    except OSError:
+        return False
 
 def main():
     # 디렉토리 변경
@@ -25,12 +26,13 @@ def main():
         import streamlit
         import pandas
         import plotly
-        import openpyxl
+        import python_calamine  # Rust 기반 XLSX 파서 (openpyxl보다 훨씬 빠름)
+        import openpyxl  # calamine 미지원 환경용 폴백
         print("✅ 모든 패키지가 설치되어 있습니다.")
     except ImportError as e:
         print(f"❌ 패키지 설치 필요: {e}")
         print("패키지를 설치합니다...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "streamlit", "pandas", "plotly", "openpyxl"])
+        subprocess.run([sys.executable, "-m", "pip", "install", "streamlit", "pandas", "plotly", "python-calamine", "openpyxl"])
     
     # Streamlit 실행
     print("\n" + "="*50)